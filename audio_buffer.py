@@ -1,16 +1,39 @@
 #!/usr/bin/env python3
-from collections import deque
+import ctypes
 import threading
 import numpy as np
 
 from typing import Optional, Tuple
 
+# ctypes.memmove is a CFUNCTYPE, so every call drops the GIL and then has to win it back
+# from the UI threads. For copies of a few KB that handoff costs more than the copy, so the
+# same C memmove is bound through PYFUNCTYPE, which keeps the GIL for the call
+_memmove = ctypes.PYFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t)(
+    ctypes.cast(ctypes.memmove, ctypes.c_void_p).value
+)
+
 class TimeShiftBuffer:
-    def __init__(self, past_seconds: int, future_seconds: int, sample_rate: int, channels: int):
+    def __init__(self, past_seconds: int, future_seconds: int, sample_rate: int, channels: int,
+                 max_read_frames: int = 0):
         self.sample_rate = sample_rate
+        self._inv_sample_rate = 1.0 / sample_rate
         self.channels = channels
-        self.buffer_size = int((past_seconds + future_seconds) * sample_rate)
-        self.buffer = np.zeros((self.buffer_size, channels), dtype='int16')
+        # Round the ring up to a power of two so wrap-around is a bitmask, not a modulo
+        requested_size = int((past_seconds + future_seconds) * sample_rate)
+        self.buffer_size = 1 << (requested_size - 1).bit_length()
+        self.mask = self.buffer_size - 1
+        # Samples stay int16 end to end; the stream delivers them that way
+        self.dtype = np.dtype('int16')
+        # Ghost region: the first max_read_frames frames are mirrored past the end of
+        # the ring, so any read of up to that many frames is one contiguous copy
+        self.ghost_frames = min(max_read_frames, self.buffer_size)
+        # Flat interleaved storage: frame i occupies buffer[i * channels:(i + 1) * channels]
+        self.buffer = np.zeros((self.buffer_size + self.ghost_frames) * channels, dtype=self.dtype)
+        # The hot path copies raw int16 frames with memmove, which skips NumPy's
+        # generic assignment machinery; callers' blocks are shape-checked first
+        self._row_bytes = channels * self.buffer.itemsize
+        self._buffer_addr = self.buffer.ctypes.data
+        self._silence_cache = {}
         
         self.write_pos = 0
         self.read_pos = 0
@@ -26,41 +49,110 @@ class TimeShiftBuffer:
         self.past_frames = int(past_seconds * sample_rate)
         self.future_frames = int(future_seconds * sample_rate)
 
+    def _copy_in(self, src_addr: int, pos: int, frames: int) -> None:
+        """memmove frames from src_addr into the ring at pos, splitting at the wrap point"""
+        row_bytes = self._row_bytes
+        base = self._buffer_addr
+        n_bytes = frames * row_bytes
+        tail_bytes = (self.buffer_size - pos) * row_bytes
+        if n_bytes <= tail_bytes:
+            _memmove(base + pos * row_bytes, src_addr, n_bytes)
+            mirror_from = pos
+            mirror_to = pos + frames
+        else:
+            _memmove(base + pos * row_bytes, src_addr, tail_bytes)
+            _memmove(base, src_addr + tail_bytes, n_bytes - tail_bytes)
+            # A write long enough to wrap from inside the ghost span touches all of it
+            mirror_from = 0
+            mirror_to = pos + frames - self.buffer_size if pos >= self.ghost_frames else self.ghost_frames
+
+        # Keep the ghost copy of the ring's head in sync with whatever just landed there
+        mirror_to = min(mirror_to, self.ghost_frames)
+        if mirror_from < mirror_to:
+            _memmove(base + (self.buffer_size + mirror_from) * row_bytes,
+                     base + mirror_from * row_bytes,
+                     (mirror_to - mirror_from) * row_bytes)
+
+    def _copy_out(self, dst_addr: int, pos: int, frames: int) -> None:
+        """memmove frames from the ring at pos into dst_addr, splitting at the wrap point"""
+        row_bytes = self._row_bytes
+        base = self._buffer_addr
+        n_bytes = frames * row_bytes
+        # Reads that fit in the ghost region never need to split
+        if pos + frames <= self.buffer_size + self.ghost_frames:
+            _memmove(dst_addr, base + pos * row_bytes, n_bytes)
+        else:
+            tail_bytes = (self.buffer_size - pos) * row_bytes
+            _memmove(dst_addr, base + pos * row_bytes, tail_bytes)
+            _memmove(dst_addr + tail_bytes, base, n_bytes - tail_bytes)
+
+    def _shifted_position(self) -> int:
+        """Ring position that is live_delay_frames + time_shift behind the write head"""
+        return (self.write_pos - self.live_delay_frames - self.time_shift) & self.mask
+
+    def _recompute_read_pos(self) -> None:
+        self.read_pos = self._shifted_position()
+
+    # write() and read_into() form the single-producer/single-consumer data path
+    # and are both driven by the audio callback, so they run without the lock.
+    # Positions are plain ints, whose assignment is atomic under the GIL; the
+    # lock only serialises the control operations below against each other.
+
+    def _check_block(self, block: np.ndarray) -> int:
+        """Validate a (frames, channels) block for a raw copy and return its frame count"""
+        if block.dtype != self.dtype:
+            raise TypeError(f"TimeShiftBuffer expects {self.dtype} frames, got {block.dtype}")
+        if block.shape[1:] != (self.channels,) and not (block.ndim == 1 and self.channels == 1):
+            raise ValueError(f"Expected blocks of shape (frames, {self.channels}), got {block.shape}")
+        frames = len(block)
+        if frames > self.buffer_size:
+            raise ValueError(f"Block of {frames} frames exceeds the {self.buffer_size}-frame ring")
+        return frames
+
     def write(self, data: np.ndarray) -> None:
-        with self.lock:
-            frames_to_write = len(data)
-            
-            if self.write_pos + frames_to_write > self.buffer_size:
-                first_part = self.buffer_size - self.write_pos
-                self.buffer[self.write_pos:] = data[:first_part]
-                self.buffer[:frames_to_write-first_part] = data[first_part:]
-                self.write_pos = frames_to_write - first_part
-            else:
-                self.buffer[self.write_pos:self.write_pos + frames_to_write] = data
-                self.write_pos = (self.write_pos + frames_to_write) % self.buffer_size
-            
-            self.stored_frames = min(self.stored_frames + frames_to_write, self.buffer_size)
-            
-            if not self.playback_paused and self.pause_position is None:
-                self.read_pos = (self.write_pos - self.live_delay_frames - self.time_shift) % self.buffer_size
+        """Copy a block of frames into the ring; data is not retained, so a callback-owned view is fine"""
+        frames_to_write = self._check_block(data)
+        write_pos = self.write_pos
+        data = np.ascontiguousarray(data)
+
+        self._copy_in(data.ctypes.data, write_pos, frames_to_write)
+        write_pos = (write_pos + frames_to_write) & self.mask
+
+        # Publish the new position only once the frames are in place
+        self.write_pos = write_pos
+        self.stored_frames = min(self.stored_frames + frames_to_write, self.buffer_size)
+
+        if not self.playback_paused and self.pause_position is None:
+            self._recompute_read_pos()
 
     def read(self, frames: int) -> np.ndarray:
-        with self.lock:
-            if self.playback_paused:
-                return np.zeros((frames, self.channels), dtype='int16')
-
-            output = np.zeros((frames, self.channels), dtype='int16')
-            read_from = self.read_pos
-            
-            if read_from + frames > self.buffer_size:
-                first_part = self.buffer_size - read_from
-                output[:first_part] = self.buffer[read_from:]
-                output[first_part:] = self.buffer[:frames-first_part]
-            else:
-                output = self.buffer[read_from:read_from + frames].copy()
-            
-            self.read_pos = (read_from + frames) % self.buffer_size
-            return output
+        if self.playback_paused:
+            # Hand out a shared, read-only silence block rather than allocating zeros per call
+            silence = self._silence_cache.get(frames)
+            if silence is None:
+                silence = np.zeros((frames, self.channels), dtype=self.dtype)
+                silence.setflags(write=False)
+                self._silence_cache[frames] = silence
+            return silence
+
+        output = np.empty((frames, self.channels), dtype=self.dtype)
+        self.read_into(output)
+        return output
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Fill a caller-owned, C-contiguous (frames, channels) int16 array from the playback position"""
+        frames = self._check_block(out)
+        if not out.flags.c_contiguous:
+            raise ValueError("read_into() needs a C-contiguous output array")
+        if self.playback_paused:
+            out.fill(0)
+            return frames
+
+        read_from = self.read_pos
+        self._copy_out(out.ctypes.data, read_from, frames)
+
+        self.read_pos = (read_from + frames) & self.mask
+        return frames
 
     def reset_to_live(self) -> None:
         with self.lock:
@@ -68,18 +160,18 @@ class TimeShiftBuffer:
             self.cumulative_shift = 0  # Reset cumulative time
             self.playback_paused = False
             self.pause_position = None
-            self.read_pos = (self.write_pos - self.live_delay_frames) % self.buffer_size
+            self._recompute_read_pos()
 
     def pause(self) -> None:
         with self.lock:
             self.playback_paused = True
-            self.pause_position = (self.write_pos - self.live_delay_frames - self.time_shift) % self.buffer_size
+            self.pause_position = self._shifted_position()
 
     def resume(self) -> None:
         with self.lock:
             if self.pause_position is not None:
                 self.read_pos = self.pause_position
-                frames_since_pause = (self.write_pos - self.read_pos) % self.buffer_size
+                frames_since_pause = (self.write_pos - self.read_pos) & self.mask
                 self.time_shift = frames_since_pause
                 self.cumulative_shift = frames_since_pause  # Update cumulative time
             self.playback_paused = False
@@ -92,7 +184,7 @@ class TimeShiftBuffer:
             self.time_shift = shift
             self.cumulative_shift = shift  # Update cumulative time
             if not self.playback_paused:
-                self.read_pos = (self.write_pos - self.live_delay_frames - self.time_shift) % self.buffer_size
+                self._recompute_read_pos()
 
     def move_forward(self, frames: int) -> None:
         with self.lock:
@@ -100,28 +192,28 @@ class TimeShiftBuffer:
             self.time_shift = new_shift
             self.cumulative_shift = new_shift  # Update cumulative time
             if not self.playback_paused:
-                self.read_pos = (self.write_pos - self.live_delay_frames - self.time_shift) % self.buffer_size
+                self._recompute_read_pos()
+
+    # The accessors below only read ints and a bool that are each replaced
+    # atomically, so they skip the lock; the display may see a value one
+    # control operation stale, which is harmless for a status readout.
 
     def is_live(self) -> bool:
-        with self.lock:
-            return self.time_shift == 0 and not self.playback_paused
+        return self.time_shift == 0 and not self.playback_paused
 
     def get_remaining_buffer_time(self) -> float:
         """Return time between live and playback position"""
-        with self.lock:
-            if self.playback_paused:
-                return (self.write_pos - self.pause_position) % self.buffer_size / self.sample_rate
-            return self.time_shift / self.sample_rate
+        pause_position = self.pause_position
+        if self.playback_paused and pause_position is not None:
+            return ((self.write_pos - pause_position) & self.mask) * self._inv_sample_rate
+        return self.time_shift * self._inv_sample_rate
 
     def get_future_buffer_time(self) -> float:
         """Return remaining buffer time after current position"""
-        with self.lock:
-            return (self.stored_frames - self.time_shift) / self.sample_rate
+        return (self.stored_frames - self.time_shift) * self._inv_sample_rate
 
     def get_buffer_time(self) -> float:
-        with self.lock:
-            return self.stored_frames / self.sample_rate
+        return self.stored_frames * self._inv_sample_rate
 
     def get_delayed_time(self) -> float:
-        with self.lock:
-            return self.cumulative_shift / self.sample_rate
\ No newline at end of file
+        return self.cumulative_shift * self._inv_sample_rate
\ No newline at end of file
@@ -3,7 +3,6 @@
 
 # Standard library imports
 import threading
-import time
 import logging
 from typing import Callable, Dict
 
@@ -18,41 +17,26 @@ class ButtonHandler:
     def __init__(self, config, callbacks: Dict[str, Callable]):
         self.config = config
         self.callbacks = callbacks
-        self.running = True
         self._setup_gpio()
 
     def _setup_gpio(self) -> None:
         """Initialize GPIO pins"""
         GPIO.setmode(GPIO.BCM)
-        for pin in self.config.BUTTON_GPIO_PINS.values():
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-
-    def start_polling(self) -> threading.Thread:
-        """Start button polling thread"""
-        thread = threading.Thread(target=self._poll_buttons, daemon=True)
-        thread.start()
-        return thread
-
-    def _poll_buttons(self) -> None:
-        """Poll buttons for state changes"""
-        while self.running:
-            if not GPIO.input(self.config.BUTTON_GPIO_PINS['backward']):
-                self.callbacks['backward']()
-                time.sleep(0.2)  # Debounce delay
-            if not GPIO.input(self.config.BUTTON_GPIO_PINS['forward']):
-                self.callbacks['forward']()
-                time.sleep(0.2)
-            if not GPIO.input(self.config.BUTTON_GPIO_PINS['play_pause']):
-                self.callbacks['play_pause']()
-                time.sleep(0.2)
-            if not GPIO.input(self.config.BUTTON_GPIO_PINS['live']):
-                self.callbacks['live']()
-                time.sleep(0.2)
-            time.sleep(0.05)  # Poll interval
+        # RPi.GPIO accepts a list of channels, so configure all buttons in one call
+        GPIO.setup(list(self.config.BUTTON_GPIO_PINS.values()), GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+    def start(self) -> None:
+        """Register edge-triggered callbacks so the kernel wakes us only on a press"""
+        for name, pin in self.config.BUTTON_GPIO_PINS.items():
+            GPIO.add_event_detect(
+                pin,
+                GPIO.FALLING,
+                callback=lambda channel, callback=self.callbacks[name]: callback(),
+                bouncetime=200  # Debounce delay in ms
+            )
 
     def cleanup(self) -> None:
-        """Clean up GPIO resources"""
-        self.running = False
+        """Clean up GPIO resources (also removes edge detection)"""
         GPIO.cleanup()
 
 class RotaryHandler:
@@ -17,6 +17,10 @@ class RadioConfig:
     BLOCKSIZE: int = 1024
     INPUT_CHANNELS: int = 1
     OUTPUT_CHANNELS: int = 2
+    AUDIO_LATENCY: str = 'low'  # PortAudio latency hint; 'high' is the ALSA default and adds tens of ms
+    AUDIO_REALTIME_PRIORITY: int = 50  # SCHED_FIFO priority for the audio thread; 0 leaves the default scheduler
+    AUDIO_STATUS_LOG_INTERVAL: float = 10.0  # seconds; xrun flags seen by the audio callback are logged at most this often
+    GIL_SWITCH_INTERVAL: float = 0.001  # seconds; the audio callback must win the GIL for every block, so this caps its wait behind UI threads (default 5 ms)
 
     # Persistence Configuration
     PERSISTENCE_ENABLED: bool = True
@@ -39,13 +43,18 @@ class RadioConfig:
 
     # Tuning Configuration
     FREQUENCY_STEP: float = 0.2
+    ROTARY_BATCH_INTERVAL: float = 0.02  # seconds; encoder ticks within this window are applied as one retune
     DEFAULT_FREQUENCY: float = 99.9
 
     # RSSI Configuration
     RSSI_READ_INTERVAL: int = 15  # seconds
     ENABLE_RSSI: bool = True
+    RSSI_MAX_BARS: int = 5  # bars in the signal strength icon
+    RSSI_THREAD_NICE: int = 5  # niceness increment for the RSSI monitor thread so it yields to audio and display
 
     # Display Configuration
+    DISPLAY_FRAME_INTERVAL: float = 0.033  # seconds; redraws are coalesced to at most ~30 per second
+    DISPLAY_PAUSED_REFRESH_INTERVAL: float = 0.1  # seconds; how often the paused buffer time is re-checked
     FONT_PATH: str = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
     FONT_SIZES: Dict[str, int] = field(default_factory=lambda: {
         'small': 11,
@@ -53,5 +62,10 @@ class RadioConfig:
         'large': 27
     })
 
+    def __post_init__(self):
+        # The signal icon is drawn from the bar rectangles, so it needs at least one
+        if self.RSSI_MAX_BARS < 1:
+            raise ValueError(f"RSSI_MAX_BARS must be at least 1, got {self.RSSI_MAX_BARS}")
+
 # Create default configuration
 config = RadioConfig()
\ No newline at end of file
@@ -3,28 +3,52 @@
 
 # Standard library imports
 import threading
+import time
 import logging
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 
 # Third-party imports
-from PIL import ImageFont
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
 from luma.core.interface.serial import spi
 from luma.oled.device import ssd1306
-from luma.core.render import canvas
 import RPi.GPIO as GPIO
 
 # Local imports
 from config import RadioConfig
 
+# SSD1306 addressing commands used for partial (page range) updates
+SSD1306_COLUMN_ADDRESS = 0x21
+SSD1306_PAGE_ADDRESS = 0x22
+
+# Everything is drawn in 1 bit/pixel, the panel's native depth, so no conversion is needed before sending
+FRAME_MODE = '1'
+
+@lru_cache(maxsize=None)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per (path, size) for the whole process"""
+    return ImageFont.truetype(path, size)
+
+@lru_cache(maxsize=256)
+def _measure(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+    """Memoized font.getbbox; displayed strings come from a small set (frequencies, offsets, messages)"""
+    return font.getbbox(text)
+
 class Display:
     def __init__(self, config):
         self.config = config
         self.current_message = None
-        self.message_timer = None
+        self._message_expires = 0.0
         self._last_freq = None
         self._last_paused = None
         self._last_rssi_handler = None
         self._last_audio_buffer = None
+        self._last_state = None
+        self._freq_tenths = None
+        self._freq_text = None
+        self._buffer_tenths = None
+        self._buffer_text = None
         
         # Disable GPIO warnings
         GPIO.setmode(GPIO.BCM)
@@ -33,103 +57,264 @@ class Display:
         # Initialize OLED
         serial_interface = spi(device=0, port=0)
         self.oled = ssd1306(serial_interface)
+        self._pages = self.oled.height // 8
+        self._prev_pages = None  # Last frame sent, in SSD1306 page layout
+        # One working frame, redrawn in place on every update
+        self._frame = Image.new(FRAME_MODE, self.oled.size, 0)
+        self._frame_draw = ImageDraw.Draw(self._frame, FRAME_MODE)
         
         # Initialize fonts
         self.fonts = self._initialize_fonts()
+        self._bbox = self._initialize_bboxes()
+        self._bar_coords = self._initialize_bar_coords(self.config.RSSI_MAX_BARS)
+        self._signal_icons = self._initialize_signal_icons()
+        self._initialize_layout()
+        # Frequency + status layer, rendered once per (freq, status) and blitted each frame
+        self._background = lru_cache(maxsize=64)(self._render_background)
+
+        # Coalesce update requests from every thread onto one refresh thread
+        self.running = True
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._last_draw = 0.0
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresh_thread.start()
 
     def _initialize_fonts(self) -> Dict[str, ImageFont.FreeTypeFont]:
         """Initialize fonts with fallbacks"""
         fonts = {}
         for name, size in self.config.FONT_SIZES.items():
             try:
-                fonts[name] = ImageFont.truetype(self.config.FONT_PATH, size)
+                fonts[name] = _get_font(self.config.FONT_PATH, size)
             except IOError:
                 logging.warning(f"Failed to load {name} font, using default")
                 fonts[name] = ImageFont.load_default()
         return fonts
 
-    def clear_message(self) -> None:
-        """Clear temporary message from display and trigger update"""
-        print("Clearing")
-        self.current_message = None
-        # Trigger a display update with the last known state
-        if self._last_freq is not None:
+    def _initialize_bboxes(self) -> Dict[Tuple[str, str], Tuple[int, int, int, int]]:
+        """Precompute bounding boxes for the fixed strings drawn every frame"""
+        fixed_texts = [
+            ('small', "MHz"),
+            ('small', "PAUSED"),
+            ('small', "PLAYING"),
+            ('small', "LIVE")
+        ]
+        return {(name, text): self.fonts[name].getbbox(text) for name, text in fixed_texts}
+
+    @staticmethod
+    def _initialize_bar_coords(max_bars: int = 5) -> List[Tuple[int, int, int, int]]:
+        """Precompute the rectangle for each signal strength bar"""
+        bar_width = 2
+        bar_spacing = 1
+        max_height = 10  # The tallest bar stays 10 px whatever the bar count
+        x_start = 11
+        y_bottom = 11
+
+        coords = []
+        for i in range(max_bars):
+            x1 = x_start + i * (bar_width + bar_spacing)
+            bar_height = max(1, (i + 1) * max_height // max_bars)
+            coords.append((x1, y_bottom - bar_height + 1, x1 + bar_width - 1, y_bottom))
+        return coords
+
+    def _initialize_signal_icons(self) -> List[Image.Image]:
+        """Prerender the antenna with 0 to 5 bars so each frame is a single blit"""
+        width = self._bar_coords[-1][2] + 1
+        height = self._bar_coords[-1][3] + 1
+        icons = []
+        for bars in range(len(self._bar_coords) + 1):
+            icon = Image.new(FRAME_MODE, (width, height), 0)
+            self._draw_signal_strength(ImageDraw.Draw(icon, FRAME_MODE), bars)
+            icons.append(icon)
+        return icons
+
+    def _text_bbox(self, name: str, text: str) -> Tuple[int, int, int, int]:
+        """Return the bounding box of text in the named font, using the fixed-string cache"""
+        return self._bbox.get((name, text)) or _measure(self.fonts[name], text)
+
+    def _redraw_last(self) -> None:
+        """Redraw the last known state on the refresh thread"""
+        if self._last_freq is None:
+            return
+        try:
             self.update(
                 self._last_freq,
                 self._last_paused,
                 self._last_rssi_handler,
                 self._last_audio_buffer
             )
+        except Exception as e:
+            logging.error(f"Display update error: {e}")
+        self._last_draw = time.monotonic()
+
+    def request_update(self, freq: float, paused: bool, rssi_handler=None, audio_buffer=None, message: Optional[str] = None) -> None:
+        """Queue a display update; bursts of requests collapse into one redraw per frame interval"""
+        with self._pending_lock:
+            # Don't let a plain refresh overwrite a message that hasn't been drawn yet
+            if message is None and self._pending is not None:
+                message = self._pending[4]
+            self._pending = (freq, paused, rssi_handler, audio_buffer, message)
+        self._dirty.set()
+
+    def _refresh_loop(self) -> None:
+        """Draw the latest requested state, at most once per DISPLAY_FRAME_INTERVAL"""
+        while True:
+            # Wake on our own when a message's display time runs out, and
+            # periodically while paused so the buffer time keeps counting
+            timeout = None
+            if self.current_message:
+                timeout = max(0.0, self._message_expires - time.monotonic())
+            if self._last_paused and self._last_audio_buffer is not None:
+                interval = self.config.DISPLAY_PAUSED_REFRESH_INTERVAL
+                timeout = interval if timeout is None else min(timeout, interval)
+            if not self._dirty.wait(timeout):
+                # update() drops an expired message and skips the frame if nothing visible changed
+                self._redraw_last()
+                continue
+            if not self.running:
+                break
+
+            # Messages are drawn right away; plain refreshes wait out the frame interval
+            with self._pending_lock:
+                has_message = self._pending is not None and self._pending[4] is not None
+            if not has_message:
+                delay = self._last_draw + self.config.DISPLAY_FRAME_INTERVAL - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+            self._dirty.clear()
+            with self._pending_lock:
+                pending, self._pending = self._pending, None
+            if pending is None:
+                continue
+
+            try:
+                self.update(*pending)
+            except Exception as e:
+                logging.error(f"Display update error: {e}")
+            self._last_draw = time.monotonic()
 
     def update(self, freq: float, paused: bool, rssi_handler=None, audio_buffer=None, message: Optional[str] = None) -> None:
-        """Update OLED display with current status"""
+        """Update OLED display with current status (runs on the refresh thread; use request_update)"""
+        if self.current_message and time.monotonic() >= self._message_expires:
+            self.current_message = None
+
         # Store the current state
         self._last_freq = freq
         self._last_paused = paused
         self._last_rssi_handler = rssi_handler
         self._last_audio_buffer = audio_buffer
-        
-        with canvas(self.oled) as draw:
-            # Clear display
-            draw.rectangle(self.oled.bounding_box, outline=0, fill=0)
 
-            # Draw frequency
-            self._draw_frequency(draw, freq)
-            
-            # Draw RSSI if available
-            if rssi_handler and self.config.ENABLE_RSSI:
-                self._draw_signal_strength(draw, rssi_handler)
-            
-            # Draw playback status
-            self._draw_playback_status(draw, paused)
-            
-            # Draw buffer time if available
-            if audio_buffer:
-                self._draw_buffer_time(draw, audio_buffer, paused)
-            
-            # Draw message
-            self._draw_message(draw, message)
+        bars = rssi_handler.get_bars() if rssi_handler and self.config.ENABLE_RSSI else None
+        buffer_text = self._format_buffer_time(audio_buffer, paused) if audio_buffer else None
+
+        # Skip the redraw (and SPI transfer) if nothing visible has changed
+        freq_text = self._format_frequency(freq)
+        state = (freq_text, paused, bars, buffer_text, message, self.current_message)
+        if message is None and state == self._last_state:
+            return
+        self._last_state = state
+
+        # Only draw status if no message is showing
+        status_text = None if self.current_message else ("PAUSED" if paused else "PLAYING")
+
+        draw = self._frame_draw
+
+        # Blit frequency and playback status; the full-size paste also clears the last frame
+        self._frame.paste(self._background(freq_text, status_text))
+
+        # Draw RSSI if available
+        if bars is not None:
+            draw.bitmap((0, 0), self._signal_icons[bars], fill="white")
+
+        # Draw buffer time if available
+        if buffer_text is not None:
+            self._draw_buffer_time(draw, buffer_text)
 
-    def _draw_frequency(self, draw, freq: float) -> None:
+        # Draw message
+        self._draw_message(draw, message)
+
+        self._flush(self._frame)
+
+    def _flush(self, image: Image.Image) -> None:
+        """Send only the range of 8-pixel pages that differs from the previous frame"""
+        assert image.mode == FRAME_MODE
+        width = self.oled.width
+        pixels = np.asarray(image).reshape(self._pages, 8, width)
+        # One byte per column per page, least significant bit = top row
+        pages = np.packbits(pixels, axis=1, bitorder='little').reshape(self._pages, width)
+
+        if self._prev_pages is None:
+            changed = np.arange(self._pages)
+        else:
+            changed = np.flatnonzero((pages != self._prev_pages).any(axis=1))
+        if len(changed) == 0:
+            return
+
+        # Exactly two SPI writes per frame: the whole addressing window as one
+        # command burst (D/C low), then every changed page as one data burst (D/C high)
+        first, last = int(changed[0]), int(changed[-1])
+        col_start = getattr(self.oled, '_colstart', 0)
+        self.oled.command(
+            SSD1306_COLUMN_ADDRESS, col_start, col_start + width - 1,
+            SSD1306_PAGE_ADDRESS, first, last
+        )
+        # spidev accepts any byte sequence, so skip building a Python list of ints
+        self.oled.data(pages[first:last + 1].tobytes())
+        self._prev_pages = pages
+
+    def _render_background(self, freq_text: str, status_text: Optional[str]) -> Image.Image:
+        """Render the frequency and playback status into a 1-bit image"""
+        image = Image.new(FRAME_MODE, self.oled.size, 0)
+        draw = ImageDraw.Draw(image, FRAME_MODE)
+        self._draw_frequency(draw, freq_text)
+        if status_text:
+            self._draw_playback_status(draw, status_text)
+        return image
+
+    def _initialize_layout(self) -> None:
+        """Precompute geometry for the fixed MHz label and playback status texts"""
+        self._center_x = self.oled.width // 2
+        self._center_y = self.oled.height // 2
+
+        bbox_mhz = self._text_bbox('small', "MHz")
+        self._mhz_width = bbox_mhz[2] - bbox_mhz[0]
+        self._mhz_height = bbox_mhz[3] - bbox_mhz[1]
+
+        self._status_pos = {}
+        for status_text in ("PAUSED", "PLAYING"):
+            bbox_status = self._text_bbox('small', status_text)
+            status_width = bbox_status[2] - bbox_status[0]
+            status_height = bbox_status[3] - bbox_status[1]
+            self._status_pos[status_text] = (
+                (self.oled.width - status_width) // 2,
+                self.oled.height - status_height - 3
+            )
+
+    def _draw_frequency(self, draw, freq_text: str) -> None:
         """Draw frequency display with perfect horizontal and vertical centering"""
         # Get frequency text dimensions
-        freq_text = f"{freq:.1f}"
-        bbox_freq = self.fonts['large'].getbbox(freq_text)
+        bbox_freq = self._text_bbox('large', freq_text)
         freq_width = bbox_freq[2] - bbox_freq[0]
         freq_height = bbox_freq[3] - bbox_freq[1]
 
-        # Get MHz text dimensions
-        mhz_text = "MHz"
-        bbox_mhz = self.fonts['small'].getbbox(mhz_text)
-        mhz_width = bbox_mhz[2] - bbox_mhz[0]
-        mhz_height = bbox_mhz[3] - bbox_mhz[1]
-
-        # Calculate total width and height for centering
-        spacing = 2  # Space between frequency and MHz
-        total_width = freq_width + spacing + mhz_width
-        total_height = max(freq_height, mhz_height)
-
-        # Calculate center positions
-        center_x = 128 // 2  # Screen width / 2
-        center_y = 32  # Screen height / 2 (assuming 64 pixel height)
-
         # Calculate starting positions for perfect centering
-        freq_x = center_x - (total_width // 2)
+        spacing = 2  # Space between frequency and MHz
+        total_width = freq_width + spacing + self._mhz_width
+        freq_x = self._center_x - (total_width // 2)
         mhz_x = freq_x + freq_width + spacing
 
         # Vertically align both texts to middle
-        freq_y = center_y - (freq_height // 2)
-        mhz_y = center_y - (mhz_height // 2)
+        freq_y = self._center_y - (freq_height // 2)
+        mhz_y = self._center_y - (self._mhz_height // 2)
 
         # Draw the texts
         draw.text((freq_x, freq_y -5), freq_text, fill="white", font=self.fonts['large'])
-        draw.text((mhz_x, mhz_y + 4), mhz_text, fill="white", font=self.fonts['small'])
+        draw.text((mhz_x, mhz_y + 4), "MHz", fill="white", font=self.fonts['small'])
 
-    def _draw_signal_strength(self, draw, rssi_handler) -> None:
+    def _draw_signal_strength(self, draw, bars: int) -> None:
         """Draw signal strength bars with antenna icon"""
-        rssi = rssi_handler.get_rssi()
-        bars = rssi_handler.rssi_to_bars(rssi)
-        
         # Draw antenna icon (7px wide × 10px high)
         x_ant = 2
         y_ant = 3  # Start at top
@@ -148,50 +333,36 @@ class Display:
         draw.point((x_ant + 3, y_ant + 8), fill="white")                  # Row 9
 
         
-        # Bar configuration
-        bar_width = 2
-        bar_spacing = 1
-        base_height = 2
-        x_start = 11
-        y_bottom = 11
-        
         # Draw signal strength bars
-        for i in range(bars):
-            bar_height = (i + 1) * base_height
-            y2 = y_bottom
-            y1 = y_bottom - bar_height + 1
-            
-            draw.rectangle([
-                x_start + i * (bar_width + bar_spacing),
-                y1,
-                x_start + i * (bar_width + bar_spacing) + bar_width - 1,
-                y2
-            ], fill="white")
+        for coords in self._bar_coords[:bars]:
+            draw.rectangle(coords, fill="white")
 
-    def _draw_playback_status(self, draw, paused: bool) -> None:
+    def _draw_playback_status(self, draw, status_text: str) -> None:
         """Draw playback status centered at the bottom of display"""
-        if not self.current_message:  # Only draw status if no message is showing
-            status_text = "PAUSED" if paused else "PLAYING"
-            bbox_status = self.fonts['small'].getbbox(status_text)
-            status_width = bbox_status[2] - bbox_status[0]
-            status_height = bbox_status[3] - bbox_status[1]
-            
-            status_x = (128 - status_width) // 2
-            status_y = 64 - status_height - 3
-            
-            draw.text((status_x, status_y), status_text, fill="white", font=self.fonts['small'])
+        draw.text(self._status_pos[status_text], status_text, fill="white", font=self.fonts['small'])
 
-    def _draw_buffer_time(self, draw, audio_buffer, paused: bool) -> None:
-        """Draw buffer time based on playback state: live, paused, or buffered playback."""
-        
+    def _format_buffer_time(self, audio_buffer, paused: bool) -> str:
+        """Format buffer time based on playback state: live, paused, or buffered playback."""
         if audio_buffer.is_live() and not paused:
-            buffer_text = "LIVE"
-        elif paused:
-            buffer_text = f"-{audio_buffer.get_remaining_buffer_time():.1f}s"
-        else:
-            buffer_text = f"-{audio_buffer.get_remaining_buffer_time():.1f}s"
+            return "LIVE"
+        # Only re-format when the displayed tenth of a second changes
+        tenths = round(audio_buffer.get_remaining_buffer_time() * 10)
+        if tenths != self._buffer_tenths:
+            self._buffer_tenths = tenths
+            self._buffer_text = f"-{tenths / 10:.1f}s"
+        return self._buffer_text
+
+    def _format_frequency(self, freq: float) -> str:
+        """Format frequency to one decimal, re-formatting only when the tenths change"""
+        tenths = round(freq * 10)
+        if tenths != self._freq_tenths:
+            self._freq_tenths = tenths
+            self._freq_text = f"{tenths / 10:.1f}"
+        return self._freq_text
 
-        bbox_buffer = self.fonts['small'].getbbox(buffer_text)
+    def _draw_buffer_time(self, draw, buffer_text: str) -> None:
+        """Draw buffer time text in the top right corner"""
+        bbox_buffer = self._text_bbox('small', buffer_text)
         buffer_width = bbox_buffer[2] - bbox_buffer[0]
         draw.text((128 - buffer_width - 2, 2), buffer_text, fill="white", font=self.fonts['small'])
 
@@ -199,7 +370,7 @@ class Display:
         """Draw temporary message with full-width black background over playback status"""
         if message:
             self.current_message = message
-            bbox_message = self.fonts['small'].getbbox(message)
+            bbox_message = self._text_bbox('small', message)
             message_width = bbox_message[2] - bbox_message[0]
             message_height = bbox_message[3] - bbox_message[1]
             
@@ -216,13 +387,10 @@ class Display:
             
             draw.text((message_x, message_y), message, fill="white", font=self.fonts['small'])
             
-            if self.message_timer and self.message_timer.is_alive():
-                self.message_timer.cancel()
-            self.message_timer = threading.Timer(1.0, self.clear_message)
-            self.message_timer.start()
+            self._message_expires = time.monotonic() + 1.0
         
         elif self.current_message:
-            bbox_message = self.fonts['small'].getbbox(self.current_message)
+            bbox_message = self._text_bbox('small', self.current_message)
             message_width = bbox_message[2] - bbox_message[0]
             message_height = bbox_message[3] - bbox_message[1]
             
@@ -241,5 +409,9 @@ class Display:
 
     def cleanup(self) -> None:
         """Clean up display resources"""
+        self.running = False
+        self._dirty.set()
+        self._refresh_thread.join(timeout=1.0)
+        self._prev_pages = None
         self.oled.clear()
         self.oled.show()
\ No newline at end of file
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# i2c_worker.py - Single owner thread for all I2C traffic
+
+# Standard library imports
+import queue
+import threading
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+# Third-party imports
+from smbus2 import SMBus
+
+class I2CWorker:
+    """Own the SMBus handle and run every I2C transaction on one thread, in submission order"""
+
+    def __init__(self, bus_number: int):
+        self._bus_number = bus_number
+        # Opened by the first operation, so a bus that isn't up yet just fails that operation
+        self._bus: Optional[SMBus] = None
+        self._queue = queue.Queue()
+        self.running = True
+        # Makes submit's running check and enqueue atomic with respect to close()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, operation: Callable[[SMBus], Any]) -> Future:
+        """Queue operation(bus) on the I2C thread; the returned future holds its result"""
+        future = Future()
+        with self._lock:
+            if not self.running:
+                raise RuntimeError("I2C worker has been closed")
+            self._queue.put((operation, future))
+        return future
+
+    def _run(self) -> None:
+        """Execute queued operations until close() sends the stop marker"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            operation, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                # A bus dropped after an error is reopened lazily by the next operation
+                if self._bus is None:
+                    self._bus = SMBus(self._bus_number)
+                future.set_result(operation(self._bus))
+            except OSError as e:
+                future.set_exception(e)
+                self._drop_bus()
+            except Exception as e:
+                future.set_exception(e)
+
+        # Only this thread ever uses the bus, so it is also the one to close it
+        self._drop_bus()
+
+    def _drop_bus(self) -> None:
+        """Close the bus after an I/O error so a transient fault recovers on the next operation"""
+        bus, self._bus = self._bus, None
+        if bus is not None:
+            try:
+                bus.close()
+            except Exception as e:
+                logging.error(f"Error closing I2C bus: {e}")
+
+    def close(self) -> None:
+        """Fail operations still queued, let the one in flight finish, then stop the thread"""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            while True:
+                try:
+                    _, future = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                # A caller may already have cancelled it, and a cancelled future rejects results
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RuntimeError("I2C worker has been closed"))
+            self._queue.put(None)
+
+        # The worker closes the bus itself on exit, so a slow operation is never cut off
+        self._thread.join(timeout=1.0)
+        if self._thread.is_alive():
+            logging.warning("I2C worker still busy at shutdown; it will close the bus when done")
@@ -2,10 +2,12 @@
 # main.py - Main application
 
 # Standard library imports
+import os
+import sys
 import threading
 import time
 import logging
-from typing import NoReturn
+from typing import NoReturn, Optional
 
 # Third-party imports
 import sounddevice as sd
@@ -17,25 +19,27 @@ from audio_buffer import TimeShiftBuffer
 from display import Display
 from buttons import ButtonHandler, RotaryHandler
 from radio import Radio
-from rssi import RSSIHandler
+from rssi import RSSIHandler, TunerStatus
 from persistence import FrequencyPersistence  # Add at top with other imports
-from smbus2 import SMBus, i2c_msg
+from i2c_worker import I2CWorker
+from smbus2 import i2c_msg
 
 class FMRadio:
     def __init__(self):
+        # One thread owns the I2C bus; the probe, tuner and RSSI reader all submit to it.
+        # It opens the bus lazily and reopens it after an error, so the probe can retry
+        self.i2c = I2CWorker(config.I2C_BUS_NUMBER)
+
         # Wait for I2C bus to be ready
         max_retries = 10
         retry_delay = 1
         
         for attempt in range(max_retries):
             try:
-                bus = SMBus(config.I2C_BUS_NUMBER)
-                read = i2c_msg.read(config.TEA5767_ADDRESS, 5)
-                bus.i2c_rdwr(read)
-                status = list(read)
-                rssi = (status[3] >> 4) & 0x0F
-                logging.info(f"Initial I2C test - RSSI value: {rssi}")
-                bus.close()
+                status = self.i2c.submit(self._probe_tuner).result()
+                # Ready flag: the tuner has already locked onto a station
+                tuner_ready = status.ready
+                logging.info(f"Initial I2C test - RSSI value: {status.rssi}, ready: {tuner_ready}")
                 logging.info("I2C bus is ready")
                 break
             except Exception as e:
@@ -47,16 +51,31 @@ class FMRadio:
                     raise
         
         # Initialize components
-        self.running = True
+        self._shutdown = threading.Event()
         self.audio_buffer = TimeShiftBuffer(
             past_seconds=config.PAST_BUFFER_SECONDS,
             future_seconds=config.FUTURE_BUFFER_SECONDS,
             sample_rate=config.SAMPLE_RATE,
-            channels=config.INPUT_CHANNELS
+            channels=config.INPUT_CHANNELS,
+            max_read_frames=config.BLOCKSIZE
         )
+        # Scratch block reused by every audio callback
+        self._playback_block = np.zeros((config.BLOCKSIZE, config.INPUT_CHANNELS), dtype='int16')
+        # Column view of the scratch block used by the mono upmix, built once rather than twice per block
+        self._mono_column = self._playback_block[:, 0]
+        # Resolve channel layout once instead of on every audio block
+        self._in_channels = config.INPUT_CHANNELS
+        self._needs_stereo_expand = config.INPUT_CHANNELS == 1 and config.OUTPUT_CHANNELS == 2
+        self._direct_output = config.INPUT_CHANNELS == config.OUTPUT_CHANNELS
+        self._write_audio = self.audio_buffer.write
+        self._read_audio_into = self.audio_buffer.read_into
+        # Set by the audio callback only; the main thread reports them
+        self._audio_status = None
+        self._audio_status_count = 0
         
         self.display = Display(config)
-        self.rssi_handler = RSSIHandler(config)
+        self._request_display_update = self.display.request_update
+        self.rssi_handler = RSSIHandler(config, self.i2c)
         
         # Initialize persistence and get starting frequency
         self.persistence = FrequencyPersistence(config)
@@ -66,25 +85,23 @@ class FMRadio:
         self.radio = Radio(config, 
             None,  # No display callback yet
             self.rssi_handler,
+            self.i2c,
             self.persistence
         )
         
-        # Prime the radio silently
-        logging.info("Priming radio")
-        self.radio.set_frequency(88.1)
-        time.sleep(0.5)
+        # Prime the radio silently, but only if the tuner has not locked yet;
+        # run() already waits for the PLL to settle after the real tune
+        if not tuner_ready:
+            logging.info("Priming radio")
+            self.radio.set_frequency(88.1)
+            time.sleep(0.5)
         
         # Now set the real frequency
         logging.info(f"Setting to target frequency {starting_frequency}")
         self.radio.set_frequency(starting_frequency)
         
         # Only now set up the display callback
-        self.radio.display_callback = lambda: self.display.update(
-            self.radio.get_frequency(),
-            self.audio_buffer.playback_paused,
-            self.rssi_handler,
-            self.audio_buffer
-        )
+        self.radio.display_callback = self._refresh
         
         # Trigger initial display update
         if self.radio.display_callback:
@@ -98,70 +115,85 @@ class FMRadio:
             'live': self._on_live
         }
         
+        # Each forward/backward press moves playback by half a second
+        self._seek_frames = int(config.SAMPLE_RATE * 0.5)
+        # Rotary ticks accumulate here and are applied as one retune
+        self._pending_delta = 0
+        self._rotary_lock = threading.Lock()
+        self._rotary_timer = None
+        
         self.button_handler = ButtonHandler(config, self.button_callbacks)
         self.rotary_handler = RotaryHandler(config, self._on_rotary)
 
 
+    @staticmethod
+    def _probe_tuner(bus) -> TunerStatus:
+        """Read the tuner's status bytes once; runs on the I2C thread"""
+        read = i2c_msg.read(config.TEA5767_ADDRESS, 5)
+        bus.i2c_rdwr(read)
+        return TunerStatus.from_bytes(bytes(read))
+
     def _audio_callback(self, indata, outdata, frames, time_info, status):
         """Handle audio streaming and playback."""
+        # Just record xrun flags; logging takes locks and does file I/O, so it happens off this thread
         if status:
-            logging.warning(f"Audio callback status: {status}")
+            self._audio_status = status
+            self._audio_status_count += 1
+
+        # Write incoming audio to buffer; write() copies it into the ring, so no copy here
+        self._write_audio(indata)
+
+        # Paused: emit silence with one memset, no buffer read or upmix
+        if self.audio_buffer.playback_paused:
+            outdata.fill(0)
+            return
 
-        # Write incoming audio to buffer
-        self.audio_buffer.write(indata.copy())
+        # Matching channel layouts: copy from the ring straight into PortAudio's buffer
+        if self._direct_output:
+            self._read_audio_into(outdata)
+            return
 
         # Get buffered data for playback
-        buffered_data = self.audio_buffer.read(frames)
+        buffered_data = self._playback_block
+        if len(buffered_data) != frames:
+            buffered_data = self._playback_block = np.zeros((frames, self._in_channels), dtype='int16')
+            self._mono_column = buffered_data[:, 0]
+        self._read_audio_into(buffered_data)
         
         # Handle stereo conversion if needed
-        if config.INPUT_CHANNELS == 1 and config.OUTPUT_CHANNELS == 2:
-            outdata[:] = np.repeat(buffered_data, 2, axis=1)
+        if self._needs_stereo_expand:
+            # Write the mono column straight into both output channels, no temporary
+            mono = self._mono_column
+            outdata[:, 0] = mono
+            outdata[:, 1] = mono
         else:
             outdata[:] = buffered_data
      
 
-    def _on_backward(self):
-        """Handle backward button press"""
-        previous_position = self.audio_buffer.get_delayed_time()
-        
-        # Original rewind logic
-        half_second_frames = int(config.SAMPLE_RATE * 0.5)
-        self.audio_buffer.move_backward(half_second_frames)
-        logging.info("Moved playback backward by 0.5 seconds")
-        
-        new_position = self.audio_buffer.get_delayed_time()
-
-        self.display.update(
-            self.radio.get_frequency(),
+    def _refresh(self, message: Optional[str] = None) -> None:
+        """Queue a display update with the current radio and playback state"""
+        self._request_display_update(
+            self.radio.frequency,
             self.audio_buffer.playback_paused,
             self.rssi_handler,
             self.audio_buffer,
-            message="-0.5s"
+            message=message
         )
 
+    def _on_backward(self):
+        """Handle backward button press"""
+        self.audio_buffer.move_backward(self._seek_frames)
+        logging.info("Moved playback backward by 0.5 seconds")
+        self._refresh("-0.5s")
+
     def _on_forward(self):
         """Handle forward button press"""
-        previous_position = self.audio_buffer.get_delayed_time()
-        
-        # Original forward logic
-        half_second_frames = int(config.SAMPLE_RATE * 0.5)
-        self.audio_buffer.move_forward(half_second_frames)
+        self.audio_buffer.move_forward(self._seek_frames)
         logging.info("Moved playback forward by 0.5 seconds")
-        
-        new_position = self.audio_buffer.get_delayed_time()
-
-        self.display.update(
-            self.radio.get_frequency(),
-            self.audio_buffer.playback_paused,
-            self.rssi_handler,
-            self.audio_buffer,
-            message="+0.5s"
-        )
+        self._refresh("+0.5s")
 
     def _on_play_pause(self):
         """Handle play/pause button press"""
-        current_position = self.audio_buffer.get_delayed_time()
-        
         # Original play/pause toggle logic
         if not self.audio_buffer.playback_paused:
             self.audio_buffer.pause()
@@ -172,46 +204,45 @@ class FMRadio:
         
         logging.info(f"Playback {state}")
 
-        self.display.update(
-            self.radio.get_frequency(),
-            self.audio_buffer.playback_paused,
-            self.rssi_handler,
-            self.audio_buffer
-        )
+        self._refresh()
 
 
     def _on_live(self):
         """Handle live button press"""
         self.audio_buffer.reset_to_live()
         logging.info("Playback reset to live")
-        self.display.update(
-            self.radio.get_frequency(),
-            self.audio_buffer.playback_paused,
-            self.rssi_handler,
-            self.audio_buffer,
-            message="Reset to Live"
-        )
+        self._refresh("Reset to Live")
 
     def _on_rotary(self, value):
         """Handle rotary encoder rotation"""
+        # The first tick opens a batch window; ticks inside it just add to the delta
+        with self._rotary_lock:
+            self._pending_delta += value
+            if self._rotary_timer is None:
+                self._rotary_timer = threading.Timer(config.ROTARY_BATCH_INTERVAL, self._apply_rotary)
+                self._rotary_timer.daemon = True
+                self._rotary_timer.start()
+
+    def _apply_rotary(self) -> None:
+        """Retune once for all the ticks in the batch window"""
+        with self._rotary_lock:
+            delta, self._pending_delta = self._pending_delta, 0
+            self._rotary_timer = None
+        if not delta:
+            return
+
         # Check if we're playing from buffer
         is_buffered = not self.audio_buffer.is_live()
         
         # Adjust frequency regardless of playback state
-        self.radio.adjust_frequency(value)
+        self.radio.adjust_frequency(delta)
         
         # If we were playing from buffer, reset to live
         if is_buffered:
             self.audio_buffer.reset_to_live()
             logging.info("Playback reset to live after frequency change")
             # Update display with reset message
-            self.display.update(
-                self.radio.get_frequency(),
-                self.audio_buffer.playback_paused,
-                self.rssi_handler,
-                self.audio_buffer,
-                message="Reset to Live"
-            )
+            self._refresh("Reset to Live")
 
     def run(self) -> NoReturn:
         """Main run loop"""
@@ -223,49 +254,44 @@ class FMRadio:
             # Initial RSSI read and display update
             if config.ENABLE_RSSI:
                 self.rssi_handler.read_signal_strength()
-            self.display.update(
-                self.radio.get_frequency(),
-                self.audio_buffer.playback_paused,
-                self.rssi_handler,
-                self.audio_buffer
-            )
+            self._refresh()
 
             # Start threads
-            button_thread = self.button_handler.start_polling()
+            self.button_handler.start()
             rotary_thread = self.rotary_handler.start()
             if config.ENABLE_RSSI:
-                rssi_thread = self.rssi_handler.start_monitoring(
-                    lambda: self.display.update(
-                        self.radio.get_frequency(),
-                        self.audio_buffer.playback_paused,
-                        self.rssi_handler,
-                        self.audio_buffer
-                    )
-                )
+                rssi_thread = self.rssi_handler.start_monitoring(self._refresh)
+
+            # The audio callback holds the GIL for its ring copies like any other thread, so
+            # a shorter switch interval caps how long a busy UI thread can keep it waiting
+            sys.setswitchinterval(config.GIL_SWITCH_INTERVAL)
+            self._set_realtime_priority()
 
             # Start audio stream
             with sd.Stream(
                 device=(config.INPUT_DEVICE, config.OUTPUT_DEVICE),
                 samplerate=config.SAMPLE_RATE,
                 blocksize=config.BLOCKSIZE,
-                dtype='int16',
+                latency=config.AUDIO_LATENCY,
+                dtype='int16',  # Keep samples int16 end to end; TimeShiftBuffer rejects anything else
                 channels=(config.INPUT_CHANNELS, config.OUTPUT_CHANNELS),
                 callback=self._audio_callback
             ):
                 logging.info("Audio streaming started")
+                # The PortAudio thread exists now and keeps its FIFO policy; drop this thread
+                # back so later children (e.g. sync on shutdown) don't inherit real-time priority
+                self._restore_normal_priority()
                 print("FM Radio is running. Press Ctrl+C to exit.")
                 
-                # Main loop with periodic display update for buffer duration while paused
-                while self.running:
-                    time.sleep(0.5)  # Refresh every 0.5 seconds
-                    if self.audio_buffer.playback_paused:
-                        # Update display with current buffer time while paused
-                        self.display.update(
-                            self.radio.get_frequency(),
-                            self.audio_buffer.playback_paused,
-                            self.rssi_handler,
-                            self.audio_buffer
-                        )
+                # Everything else is event driven (the display refreshes itself while
+                # paused), so the main thread just reports audio status until shutdown
+                reported = 0
+                while not self._shutdown.wait(config.AUDIO_STATUS_LOG_INTERVAL):
+                    count = self._audio_status_count
+                    if count != reported:
+                        logging.warning(f"Audio callback status: {self._audio_status} "
+                                        f"({count - reported} block(s) since last report)")
+                        reported = count
 
         except KeyboardInterrupt:
             logging.info("Keyboard interrupt received")
@@ -274,14 +300,42 @@ class FMRadio:
             logging.error(f"Unexpected error: {e}")
             print(f"An unexpected error occurred: {e}")
         finally:
+            # Also covers a stream that failed to open while this thread was still FIFO
+            self._restore_normal_priority()
             self.cleanup()
 
+    def _set_realtime_priority(self) -> None:
+        """Switch this thread to SCHED_FIFO so the PortAudio thread it spawns inherits it"""
+        priority = config.AUDIO_REALTIME_PRIORITY
+        if not priority:
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            logging.info(f"Audio running with SCHED_FIFO priority {priority}")
+        except (AttributeError, OSError) as e:
+            logging.warning(f"Could not enable real-time scheduling: {e}")
+
+    def _restore_normal_priority(self) -> None:
+        """Return this thread to SCHED_OTHER once the audio thread has been spawned"""
+        try:
+            if os.sched_getscheduler(0) == os.SCHED_OTHER:
+                return
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        except (AttributeError, OSError) as e:
+            logging.warning(f"Could not restore normal scheduling: {e}")
+
     def cleanup(self):
         """Clean up resources"""
-        self.running = False
+        self._shutdown.set()
+        with self._rotary_lock:
+            if self._rotary_timer:
+                self._rotary_timer.cancel()
         self.button_handler.cleanup()
         self.rotary_handler.stop()
         self.rssi_handler.stop_monitoring()
+        self.radio.cleanup()
+        self.i2c.close()
+        self.persistence.cleanup()
         self.display.cleanup()
         
         # Ensure all files are properly closed
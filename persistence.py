@@ -3,6 +3,7 @@
 
 import os
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +17,14 @@ class FrequencyPersistence:
         self.frequency_file = self.persistence_dir / "last_frequency"
         self._ensure_directory()
 
+        # Saves are handed to a writer thread; only the latest pending value is kept
+        self.running = True
+        self._pending: Optional[float] = None
+        self._pending_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
     def _ensure_directory(self) -> None:
         """Ensure persistence directory exists"""
         try:
@@ -25,17 +34,50 @@ class FrequencyPersistence:
 
     def save_frequency(self, frequency: float) -> bool:
         """
-        Save the current frequency to persistent storage.
+        Queue the current frequency to be saved to persistent storage.
+        
+        Rapid successive calls coalesce, so only the latest frequency is written.
         
         Args:
             frequency: The frequency to save
             
         Returns:
-            bool: True if save was successful, False otherwise
+            bool: True if the save was queued, False if the writer has stopped
         """
+        if not self.running:
+            return False
+        with self._pending_lock:
+            self._pending = frequency
+        self._dirty.set()
+        return True
+
+    def _writer_loop(self) -> None:
+        """Write queued frequencies off the caller's thread"""
+        while True:
+            # Once stopped, keep draining without waiting until nothing is pending
+            if self.running:
+                self._dirty.wait()
+            self._dirty.clear()
+            with self._pending_lock:
+                frequency, self._pending = self._pending, None
+            if frequency is not None:
+                self._write_frequency(frequency)
+            elif not self.running:
+                break
+
+    def _write_frequency(self, frequency: float) -> bool:
+        """Write the frequency to the persistence file"""
+        # Write a temp file synchronously and rename it over the old one, so a
+        # power cut leaves either the previous or the new frequency, never a torn file
+        tmp_file = self.frequency_file.with_suffix('.tmp')
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_DSYNC', 0)
         try:
-            with open(self.frequency_file, 'w') as f:
-                f.write(f"{frequency:.1f}")
+            fd = os.open(tmp_file, flags, 0o644)
+            try:
+                os.write(fd, f"{frequency:.1f}".encode())
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.frequency_file)
             return True
         except Exception as e:
             logging.error(f"Failed to save frequency: {e}")
@@ -62,4 +104,10 @@ class FrequencyPersistence:
             
         except (ValueError, IOError) as e:
             logging.error(f"Failed to load frequency: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def cleanup(self) -> None:
+        """Flush any pending save and stop the writer thread"""
+        self.running = False
+        self._dirty.set()
+        self._writer_thread.join(timeout=1.0)
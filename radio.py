@@ -5,46 +5,68 @@
 import threading
 import time
 import logging
-from typing import Callable
+from typing import Callable, Dict, Optional
 
 # Third-party imports
-from smbus2 import SMBus
+from smbus2 import i2c_msg
 
 # Local imports
 from config import RadioConfig
 from rssi import RSSIHandler
+from i2c_worker import I2CWorker
 
 class Radio:
-    def __init__(self, config, display_callback: Callable, rssi_handler: RSSIHandler, persistence_handler=None):
+    def __init__(self, config, display_callback: Callable, rssi_handler: RSSIHandler, i2c: I2CWorker, persistence_handler=None):
         self.config = config
         self.display_callback = display_callback
         self.rssi_handler = rssi_handler  
         self.persistence_handler = persistence_handler
         self.frequency = self.config.DEFAULT_FREQUENCY
-        self.i2c_lock = threading.Lock()
-        self.stabilization_timer = None
+        # All bus access goes through the shared I2C thread, which serialises it with RSSI reads
+        self.i2c = i2c
+        self._pll_table = self._build_pll_table()
+        # The TEA5767 has no register address, so each payload goes out as one raw write;
+        # build the message for every channel once and reuse it on each tune
+        self._tune_msgs = {
+            tenths: i2c_msg.write(self.config.TEA5767_ADDRESS, payload)
+            for tenths, payload in self._pll_table.items()
+        }
 
-    def set_frequency(self, freq: float, stabilize: bool = False, update_rssi: bool = False) -> None:
-        try:
-            freq = max(87.5, min(freq, 108.0))
-            freq = round(freq * 10) / 10.0
-            
-            self.frequency = freq
-            frequency_hz = freq * 1_000_000
-            pll = int((4 * (frequency_hz + 225_000)) / 32_768)
+        # One long-lived worker runs the delayed stabilization instead of a Timer thread per tick
+        self.running = True
+        self._stabilize_delay = 0.5
+        self._pending_freq: Optional[float] = None
+        self._stabilize_at = 0.0
+        self._stabilize_lock = threading.Lock()
+        self._stabilize_event = threading.Event()
+        self._stabilize_thread = threading.Thread(target=self._stabilize_loop, daemon=True)
+        self._stabilize_thread.start()
 
-            data = [
+    @staticmethod
+    def _build_pll_table() -> Dict[int, bytes]:
+        """Precompute the TEA5767 write payload for every tenth of a MHz in the FM band"""
+        table = {}
+        for tenths in range(875, 1081):
+            frequency_hz = tenths / 10.0 * 1_000_000
+            pll = int((4 * (frequency_hz + 225_000)) / 32_768)
+            table[tenths] = bytes([
                 (pll >> 8) & 0x3F,  # First byte
                 pll & 0xFF,         # Second byte
                 0xF0,              # Force mono mode + high side injection
                 0x90,              # Maximum sensitivity (-7dBμV)
                 0x40               # US deemphasis
-            ]
+            ])
+        return table
 
-            with self.i2c_lock:
-                bus = SMBus(self.config.I2C_BUS_NUMBER)
-                bus.write_i2c_block_data(self.config.TEA5767_ADDRESS, data[0], data[1:])
-                bus.close()
+    def set_frequency(self, freq: float, stabilize: bool = False, update_rssi: bool = False) -> None:
+        try:
+            # Clamp and round on integer tenths of a MHz (875..1080)
+            tenths = max(875, min(round(freq * 10), 1080))
+            freq = tenths / 10.0
+            
+            self.frequency = freq
+            msg = self._tune_msgs[tenths]
+            self.i2c.submit(lambda bus: bus.i2c_rdwr(msg)).result()
 
             logging.info(f"Frequency set to {freq:.1f} MHz (mono)")
 
@@ -62,25 +84,47 @@ class Radio:
             logging.error(f"Error setting frequency: {e}")
 
     def adjust_frequency(self, delta: int) -> None:
-        """Adjust frequency by delta steps and set stabilization timer with RSSI update"""
-        # Cancel previous stabilization timer if still running
-        if self.stabilization_timer and self.stabilization_timer.is_alive():
-            self.stabilization_timer.cancel()
-
+        """Adjust frequency by delta steps and schedule stabilization with RSSI update"""
         # Adjust frequency without stabilization
         new_freq = self.frequency + (delta * self.config.FREQUENCY_STEP)
         self.set_frequency(new_freq, stabilize=False)
 
-        # Set stabilization timer to run set_frequency with stabilization and RSSI update after delay
-        def stabilized_callback():
-            self.set_frequency(new_freq, stabilize=True, update_rssi=True)
-            # Save frequency after PLL lock
-            if self.persistence_handler and self.config.PERSISTENCE_ENABLED:
-                self.persistence_handler.save_frequency(new_freq)
-        
-        self.stabilization_timer = threading.Timer(0.5, stabilized_callback)
-        self.stabilization_timer.start()
+        # Each tick replaces the pending frequency and pushes the deadline back
+        with self._stabilize_lock:
+            self._pending_freq = new_freq
+            self._stabilize_at = time.monotonic() + self._stabilize_delay
+        self._stabilize_event.set()
+
+    def _stabilize_loop(self) -> None:
+        """Retune with stabilization and RSSI update once the dial has been still for the delay"""
+        timeout = None
+        while True:
+            self._stabilize_event.wait(timeout)
+            self._stabilize_event.clear()
+            if not self.running:
+                break
+
+            with self._stabilize_lock:
+                freq = self._pending_freq
+                if freq is None:
+                    timeout = None
+                    continue
+                remaining = self._stabilize_at - time.monotonic()
+                if remaining > 0:
+                    timeout = remaining
+                    continue
+                self._pending_freq = None
+
+            timeout = None
+            # set_frequency saves the frequency after PLL lock
+            self.set_frequency(freq, stabilize=True, update_rssi=True)
 
     def get_frequency(self) -> float:
         """Get current frequency"""
         return self.frequency
+
+    def cleanup(self) -> None:
+        """Stop the stabilization worker"""
+        self.running = False
+        self._stabilize_event.set()
+        self._stabilize_thread.join(timeout=1.0)
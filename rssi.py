@@ -2,79 +2,171 @@
 # rssi.py - RSSI handling functionality
 
 # Standard library imports
+import os
 import threading
 import time
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
 
 # Third-party imports
-from smbus2 import SMBus, i2c_msg
+from smbus2 import i2c_msg
 
 # Local imports
 from config import RadioConfig
+from i2c_worker import I2CWorker
+
+# Module logger, propagates to the root handlers configured in main
+log = logging.getLogger(__name__)
+
+# The 5-bar ladder lights bar k at RSSI 2, 5, 8, 11, 14; other bar counts spread
+# their thresholds evenly over that same 2..14 span
+_MIN_THRESHOLD = 2
+_MAX_THRESHOLD = 14
+
+def _bar_thresholds(max_bars: int) -> Tuple[int, ...]:
+    """Ascending RSSI threshold at which each of max_bars bars lights"""
+    if max_bars <= 1:
+        return (_MIN_THRESHOLD,) * max(max_bars, 0)
+    span = _MAX_THRESHOLD - _MIN_THRESHOLD
+    return tuple(_MIN_THRESHOLD + (k * span + (max_bars - 1) // 2) // (max_bars - 1)
+                 for k in range(max_bars))
+
+def _bars_for(rssi: int, max_bars: int) -> int:
+    """Number of bars whose threshold rssi reaches; never more than max_bars"""
+    return sum(1 for threshold in _bar_thresholds(max_bars) if rssi >= threshold)
+
+@lru_cache(maxsize=None)
+def _bars_table(max_bars: int) -> Tuple[int, ...]:
+    """Bar count for every 4-bit RSSI value, evaluated once per max_bars"""
+    return tuple(_bars_for(rssi, max_bars) for rssi in range(16))
+
+_BARS_5 = _bars_table(5)
+
+@dataclass(frozen=True)
+class TunerStatus:
+    """Everything the TEA5767 reports in its five status bytes"""
+    rssi: int = 0        # ADC level, 0-15
+    stereo: bool = False
+    ready: bool = False  # Station found or band limit reached
+    pll: int = 0         # 14-bit PLL word the tuner is locked to
+
+    @classmethod
+    def from_bytes(cls, status: bytes) -> 'TunerStatus':
+        """Decode the raw read-mode bytes"""
+        return cls(
+            rssi=(status[3] >> 4) & 0x0F,
+            stereo=bool(status[2] & 0x80),
+            ready=bool(status[0] & 0x80),
+            pll=((status[0] & 0x3F) << 8) | status[1]
+        )
+
+    @property
+    def frequency(self) -> float:
+        """Tuned frequency in MHz implied by the PLL word (high side injection)"""
+        return (self.pll * 32_768 / 4 - 225_000) / 1_000_000
+
+_NO_STATUS = TunerStatus()
 
 class RSSIHandler:
-    def __init__(self, config):
+    def __init__(self, config, i2c: I2CWorker):
         self.config = config
-        self.current_rssi = 0
-        self.rssi_lock = threading.Lock()
-        self.i2c_lock = threading.Lock()
-        self.running = True
-
-    def read_signal_strength(self) -> None:
-        """Read signal strength from the TEA5767 tuner"""
-        max_retries = 3
+        self.i2c = i2c
+        # The TEA5767 always returns its five status bytes from the start, so one
+        # read message is built up front and reused; only the I2C thread touches it
+        self._status_msg = i2c_msg.read(self.config.TEA5767_ADDRESS, 5)
+        # Written by whichever thread polls, read by the display; rebinding a reference is
+        # atomic under the GIL, so readers see either the old or new status without a lock
+        self.status = _NO_STATUS
+        # Bar conversion specialised to the configured bar count: a bare tuple index
+        self._to_bars = _bars_table(self.config.RSSI_MAX_BARS).__getitem__
+        # Set by stop_monitoring; waiting on it makes the poll interval interruptible
+        self._stop = threading.Event()
+
+    def read_signal_strength(self, max_retries: int = 3, base_delay: float = 0.02) -> None:
+        """Read signal strength from the TEA5767 tuner, backing off 20/40 ms between attempts"""
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be at least 1, got {max_retries}")
+        error = None
         for attempt in range(max_retries):
             try:
-                with self.i2c_lock:
-                    read = i2c_msg.read(self.config.TEA5767_ADDRESS, 5)
-                    bus = SMBus(self.config.I2C_BUS_NUMBER)
-                    bus.i2c_rdwr(read)
-                    status = list(read)
-                    bus.close()
-                
-                rssi = (status[3] >> 4) & 0x0F
-                with self.rssi_lock:
-                    self.current_rssi = rssi
+                self.status = self.i2c.submit(self._read_status).result()
                 return
 
+            # A missing or inaccessible bus device, or a stopped worker, won't fix itself on retry
+            except (FileNotFoundError, PermissionError, RuntimeError) as e:
+                error = e
+                break
             except Exception as e:
-                logging.error(f"Attempt {attempt + 1}: Error reading signal strength: {e}")
-                time.sleep(0.1)
+                error = e
+                if attempt < max_retries - 1:
+                    time.sleep(base_delay * (1 << attempt))
+
+        self.status = _NO_STATUS
+        log.error("Failed to read RSSI after %d attempt(s): %s", attempt + 1, error)
 
-        with self.rssi_lock:
-            self.current_rssi = 0
-        logging.error("Failed to read RSSI after multiple attempts")
+    def _read_status(self, bus) -> TunerStatus:
+        """Read and decode the TEA5767 status bytes; runs on the I2C thread"""
+        msg = self._status_msg
+        bus.i2c_rdwr(msg)
+        # Slice the raw ctypes buffer straight to bytes rather than iterating the message
+        return TunerStatus.from_bytes(msg.buf[0:5])
 
     def get_rssi(self) -> int:
         """Get the current RSSI value"""
-        with self.rssi_lock:
-            return self.current_rssi
+        return self.status.rssi
+
+    def get_stereo(self) -> bool:
+        """Whether the tuner reported a stereo signal on the last read"""
+        return self.status.stereo
+
+    def get_tuned_frequency(self) -> float:
+        """Frequency in MHz the tuner reported being locked to on the last read"""
+        return self.status.frequency
+
+    def get_bars(self, max_bars: Optional[int] = None) -> int:
+        """Get the current signal strength as a bar count, out of RSSI_MAX_BARS by default"""
+        if max_bars is None:
+            return self._to_bars(self.status.rssi)
+        return _bars_table(max_bars)[self.status.rssi]
 
     @staticmethod
     def rssi_to_bars(rssi: int, max_bars: int = 5) -> int:
         """Convert RSSI value to number of signal strength bars"""
-        if rssi >= 14:
-            return max_bars
-        elif rssi >= 11:
-            return 4
-        elif rssi >= 8:
-            return 3
-        elif rssi >= 5:
-            return 2
-        elif rssi >= 2:
-            return 1
-        else:
-            return 0
-
-    def start_monitoring(self, display_update_callback) -> None:
-        """Start periodic RSSI monitoring"""
+        # RSSI is a 4-bit field, so masking keeps the table index in range
+        if max_bars == 5:
+            return _BARS_5[rssi & 0x0F]
+        return _bars_table(max_bars)[rssi & 0x0F]
+
+    def start_monitoring(self, display_update_callback, on_change_only: bool = True) -> threading.Thread:
+        """Start periodic RSSI monitoring; by default call back only when the bar count changes"""
         def monitor_loop():
-            while self.running and self.config.ENABLE_RSSI:
-                self.read_signal_strength()
-                if display_update_callback:
-                    display_update_callback()
-                time.sleep(self.config.RSSI_READ_INTERVAL)
+            # Polling is background work; on Linux nice() applies to this thread only
+            try:
+                os.nice(self.config.RSSI_THREAD_NICE)
+            except (AttributeError, OSError) as e:
+                log.warning("Could not lower RSSI monitor priority: %s", e)
+            if not self.config.ENABLE_RSSI:
+                return
+
+            # Bind everything the loop touches to locals once
+            read = self.read_signal_strength
+            get_bars = self.get_bars
+            interval = self.config.RSSI_READ_INTERVAL
+            stop_wait = self._stop.wait
+            callback = display_update_callback
+
+            last_bars = None
+            while not self._stop.is_set():
+                read()
+                # The display only shows bars, so only redraw when the bar count changes
+                bars = get_bars()
+                if callback and (bars != last_bars or not on_change_only):
+                    callback()
+                last_bars = bars
+                if stop_wait(interval):
+                    break
 
         thread = threading.Thread(target=monitor_loop, daemon=True)
         thread.start()
@@ -82,4 +174,4 @@ class RSSIHandler:
 
     def stop_monitoring(self) -> None:
         """Stop RSSI monitoring"""
-        self.running = False
+        self._stop.set()